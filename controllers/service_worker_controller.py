@@ -17,6 +17,33 @@ from odoo.http import request, Response
 
 _logger = logging.getLogger(__name__)
 
+# Absolute path of the Service Worker script, resolved once at import
+_SW_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'static', 'src', 'service_worker', 'sw.js'
+)
+
+# Response headers for the Service Worker script. They never vary per request,
+# so they are built once at import instead of on every /pos_offline/sw.js hit.
+_SW_HEADERS = {
+    # Allow SW to control the entire /pos/ scope
+    'Service-Worker-Allowed': '/pos/',
+    # Always revalidate the SW file (browser will check for updates); storing
+    # is allowed so update checks can be answered with 304 Not Modified
+    'Cache-Control': 'no-cache',
+    'Pragma': 'no-cache',
+    'Expires': '0',
+}
+
+# /pos_offline/sw/status payload. It only depends on the module release, so it
+# is built once at import and the same dict is handed to the JSON-RPC encoder.
+_SW_STATUS = {
+    'status': 'active',
+    'version': '2.0.0',
+    'module': 'pdc_pos_offline',
+    'scope': '/pos/',
+}
+
 
 class ServiceWorkerController(http.Controller):
     """Controller to serve Service Worker with correct MIME type and scope."""
@@ -30,43 +57,34 @@ class ServiceWorkerController(http.Controller):
         - Content-Type: application/javascript (required for SW)
         - Service-Worker-Allowed: / (allows SW to control entire origin)
         - Cache-Control: no-cache (SW spec recommends no caching)
+        - ETag: validator from file mtime/size (no body hashing)
+
+        The file is served through http.Stream, which answers a matching
+        If-None-Match with 304 Not Modified and otherwise streams the file
+        (or hands it to X-Sendfile) instead of reading it into memory.
 
         Returns:
             Response: The Service Worker JavaScript with appropriate headers
         """
         try:
-            # Get path to sw.js relative to this module
-            module_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            sw_path = os.path.join(
-                module_path,
-                'static', 'src', 'service_worker', 'sw.js'
-            )
-
-            if not os.path.exists(sw_path):
-                _logger.error("Service Worker file not found at: %s", sw_path)
+            try:
+                stream = http.Stream.from_path(_SW_PATH)
+            except FileNotFoundError:
+                _logger.error("Service Worker file not found at: %s", _SW_PATH)
                 return Response(
                     "// Service Worker not found",
                     status=404,
                     mimetype='application/javascript'
                 )
 
-            with open(sw_path, 'r', encoding='utf-8') as f:
-                content = f.read()
+            stream.mimetype = 'application/javascript'
+            _logger.info("Serving Service Worker from: %s", _SW_PATH)
 
-            _logger.info("Serving Service Worker from: %s", sw_path)
-
-            return Response(
-                content,
-                mimetype='application/javascript',
-                headers={
-                    # Allow SW to control the entire /pos/ scope
-                    'Service-Worker-Allowed': '/pos/',
-                    # Don't cache the SW file itself (browser will check for updates)
-                    'Cache-Control': 'no-cache, no-store, must-revalidate',
-                    'Pragma': 'no-cache',
-                    'Expires': '0',
-                }
-            )
+            # A CSP on the SW script applies to the worker itself, so don't let
+            # Stream add its default "default-src 'none'" (it would block fetch)
+            response = stream.get_response(content_security_policy=None)
+            response.headers.update(_SW_HEADERS)
+            return response
 
         except Exception as e:
             _logger.exception("Error serving Service Worker: %s", e)
@@ -84,9 +102,4 @@ class ServiceWorkerController(http.Controller):
         Returns:
             dict: Status information including version and cache info
         """
-        return {
-            'status': 'active',
-            'version': '2.0.0',
-            'module': 'pdc_pos_offline',
-            'scope': '/pos/',
-        }
+        return _SW_STATUS
@@ -1,3 +1,4 @@
 # -*- coding: utf-8 -*-
 from . import test_backend
 from . import test_js_python_field_sync
+from . import test_service_worker_controller
@@ -16,6 +16,7 @@ Tests asset versioning functionality:
 
 import unittest
 import json
+import re
 import tempfile
 from pathlib import Path
 from unittest.mock import Mock, patch
@@ -25,6 +26,8 @@ try:
 except ImportError:
     from tools.asset_versioner import AssetVersioner, version_assets
 
+_HEX8 = re.compile(r'\A[0-9a-f]{8}\Z')
+
 
 class TestAssetVersioner(unittest.TestCase):
     """Test asset versioning functionality."""
@@ -64,8 +67,7 @@ class TestAssetVersioner(unittest.TestCase):
 
         # Verify hash format (8 hex characters)
         self.assertIsNotNone(hash_value)
-        self.assertEqual(len(hash_value), 8)
-        self.assertTrue(all(c in '0123456789abcdef' for c in hash_value))
+        self.assertIsNotNone(_HEX8.match(hash_value))
 
     def test_file_hash_consistency(self):
         """Test that same content produces same hash."""
@@ -138,6 +140,22 @@ class TestAssetVersioner(unittest.TestCase):
         large_file.write_bytes(b"x" * 1000)
         self.assertTrue(self.versioner._should_version_file(large_file))
 
+    def test_should_version_file_reuses_stat(self):
+        """Test that a caller-provided stat is used instead of a new one."""
+        asset = self.assets_dir / 'app.js'
+        asset.write_bytes(b"x" * 1000)
+        stat = asset.stat()
+
+        # _should_version_file swallows stat() errors, so assert on the mock's
+        # calls rather than relying on a raising side effect
+        with patch.object(Path, 'stat') as mock_stat:
+            self.assertTrue(self.versioner._should_version_file(asset, stat))
+            # Non-asset extensions are rejected without any stat at all
+            self.assertFalse(
+                self.versioner._should_version_file(self.assets_dir / 'logo.png')
+            )
+        mock_stat.assert_not_called()
+
     def test_generate_versions(self):
         """Test version generation for multiple files."""
         # Create test files
@@ -167,6 +185,23 @@ class TestAssetVersioner(unittest.TestCase):
             versioned = version_info['versioned']
             self.assertIn(version_info['hash'], versioned)
 
+    def test_generate_versions_parallel_hashing(self):
+        """Test that concurrent hashing matches per-file hashing."""
+        for i in range(100):
+            (self.assets_dir / f'module_{i}.js').write_bytes(
+                f"var module_{i} = {{}};".encode() * 50
+            )
+
+        versions = self.versioner.generate_versions()
+
+        self.assertEqual(len(versions), 100)
+        for original_name, version_info in versions.items():
+            self.assertEqual(
+                version_info['hash'],
+                self.versioner._compute_file_hash(self.assets_dir / original_name),
+                f"Hash mismatch for {original_name}"
+            )
+
     def test_manifest_generation(self):
         """Test manifest file generation and storage."""
         # Create test file
@@ -299,6 +334,17 @@ class TestAssetVersioner(unittest.TestCase):
         # Both files should be versioned
         self.assertEqual(len(versions), 2)
 
+    def test_directory_with_asset_extension_skipped(self):
+        """Test that directories are walked, never versioned themselves."""
+        vendor_dir = self.assets_dir / 'vendor.js'
+        vendor_dir.mkdir()
+        (vendor_dir / 'lib.js').write_bytes(b"x" * 1000)
+
+        versions = self.versioner.generate_versions()
+
+        self.assertEqual(list(versions), ['lib.js'])
+        self.assertEqual(versions['lib.js']['path'], str(Path('vendor.js') / 'lib.js'))
+
     def test_hash_length_consistency(self):
         """Test that hash length is consistent."""
         # Create multiple files
@@ -26,6 +26,11 @@ class TestJsPythonFieldSync(TransactionCase):
             'res.users': cls.env['res.users'],
             'pos.config': cls.env['pos.config'],
         }
+        # Field names per model, resolved once for the membership checks below
+        cls.model_field_sets = {
+            name: frozenset(model._fields)
+            for name, model in cls.models_to_check.items()
+        }
 
     def test_pos_session_offline_fields_exist(self):
         """
@@ -39,20 +44,18 @@ class TestJsPythonFieldSync(TransactionCase):
         Detection: This test fails if fields are removed from Python but
         still referenced in JavaScript.
         """
-        PosSession = self.env['pos.session']
-        required_fields = [
+        required_fields = {
             'last_sync_date',
             'offline_transactions_count',
-        ]
-
-        for field_name in required_fields:
-            self.assertIn(
-                field_name,
-                PosSession._fields,
-                f"Field '{field_name}' missing from pos.session model. "
-                f"This field is required by sync_manager.js syncSessionData(). "
-                f"Add it to pdc_pos_offline/models/pos_session.py"
-            )
+        }
+
+        missing = required_fields - self.model_field_sets['pos.session']
+        self.assertFalse(
+            missing,
+            f"Fields {sorted(missing)} missing from pos.session model. "
+            f"These fields are required by sync_manager.js syncSessionData(). "
+            f"Add them to pdc_pos_offline/models/pos_session.py"
+        )
 
     def test_res_users_offline_fields_exist(self):
         """
@@ -63,19 +66,17 @@ class TestJsPythonFieldSync(TransactionCase):
         - sync_manager.js reads this field during cache update
         - Field MUST exist for offline PIN authentication to work
         """
-        ResUsers = self.env['res.users']
-        required_fields = [
+        required_fields = {
             'pos_offline_pin_hash',
-        ]
-
-        for field_name in required_fields:
-            self.assertIn(
-                field_name,
-                ResUsers._fields,
-                f"Field '{field_name}' missing from res.users model. "
-                f"This field is required by offline_auth.js for PIN authentication. "
-                f"Add it to pdc_pos_offline/models/res_users.py"
-            )
+        }
+
+        missing = required_fields - self.model_field_sets['res.users']
+        self.assertFalse(
+            missing,
+            f"Fields {sorted(missing)} missing from res.users model. "
+            f"These fields are required by offline_auth.js for PIN authentication. "
+            f"Add them to pdc_pos_offline/models/res_users.py"
+        )
 
     def test_pos_session_fields_are_writable(self):
         """
@@ -102,7 +103,9 @@ class TestJsPythonFieldSync(TransactionCase):
         if not session:
             self.skipTest("No POS session available for testing")
 
-        # Try to write the sync fields (this is what JS does)
+        # Try to write the sync fields (this is what JS does); mail tracking
+        # is irrelevant here and only adds write overhead
+        session = session.with_context(tracking_disable=True, mail_notrack=True)
         try:
             from datetime import datetime
             session.write({
@@ -119,12 +122,7 @@ class TestJsPythonFieldSync(TransactionCase):
         # Verify values were written
         self.assertEqual(session.offline_transactions_count, 5)
         self.assertIsNotNone(session.last_sync_date)
-
-        # Reset to not pollute real session data
-        session.write({
-            'last_sync_date': False,
-            'offline_transactions_count': 0,
-        })
+        # No reset needed: TransactionCase rolls the write back after the test
 
     def test_js_orm_write_fields_documented(self):
         """
@@ -145,12 +143,12 @@ class TestJsPythonFieldSync(TransactionCase):
         # Verify all documented fields exist
         for js_file, model_fields in js_python_dependencies.items():
             for model_name, fields in model_fields.items():
-                if model_name in self.models_to_check:
-                    model = self.models_to_check[model_name]
-                    for field_name in fields:
-                        self.assertIn(
-                            field_name,
-                            model._fields,
-                            f"JS file '{js_file}' references '{model_name}.{field_name}' "
-                            f"but field doesn't exist in Python model."
-                        )
+                field_set = self.model_field_sets.get(model_name)
+                if field_set is None:
+                    continue
+                for field_name in fields:
+                    self.assertIn(
+                        field_name, field_set,
+                        f"JS file '{js_file}' references '{model_name}.{field_name}' "
+                        f"but field doesn't exist in Python model."
+                    )
@@ -304,15 +304,19 @@ class TestOfflineLoginSecurity(common.TransactionCase):
             'login': 'timing_test',
             'pos_offline_pin': '1234',
         })
+        pin_hash = user.pos_offline_pin_hash
 
         # Hash should be lowercase hex
-        self.assertTrue(
-            all(c in '0123456789abcdef' for c in user.pos_offline_pin_hash),
-            "Hash should be lowercase hex"
-        )
-
-        # Hash should be exactly 64 characters (SHA-256)
-        self.assertEqual(len(user.pos_offline_pin_hash), 64)
+        try:
+            digest = bytes.fromhex(pin_hash)
+        except ValueError:
+            self.fail("Hash should be lowercase hex")
+        self.assertEqual(pin_hash, pin_hash.lower(), "Hash should be lowercase hex")
+
+        # Hash should be exactly 64 characters (SHA-256); the decoded length
+        # also rules out the whitespace bytes.fromhex() tolerates
+        self.assertEqual(len(pin_hash), 64)
+        self.assertEqual(len(digest), 32)
 
     def test_SEC_002_pin_field_visibility(self):
         """
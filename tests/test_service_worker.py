@@ -12,7 +12,7 @@ These tests validate:
 4. Cache management and cleanup
 """
 
-from odoo.tests import common, tagged
+from odoo.tests import BaseCase, tagged
 from odoo import api
 import json
 import time
@@ -20,12 +20,10 @@ from datetime import datetime
 
 
 @tagged('pdc_pos_offline', 'service_worker')
-class TestServiceWorkerEnhancement(common.TransactionCase):
+class TestServiceWorkerEnhancement(BaseCase):
     """Tests for Service Worker enhancement (Task 4)"""
 
-    def setUp(self):
-        super(TestServiceWorkerEnhancement, self).setUp()
-        self.module_name = 'pdc_pos_offline'
+    module_name = 'pdc_pos_offline'
 
     def test_01_manifest_assets_included(self):
         """Test that SW enhancement modules are in manifest"""
@@ -131,12 +129,10 @@ class TestServiceWorkerEnhancement(common.TransactionCase):
 
 
 @tagged('pdc_pos_offline', 'stale_while_revalidate')
-class TestStaleWhileRevalidate(common.TransactionCase):
+class TestStaleWhileRevalidate(BaseCase):
     """Tests for Stale-While-Revalidate strategy (Task 5)"""
 
-    def setUp(self):
-        super(TestStaleWhileRevalidate, self).setUp()
-        self.cache_name = 'pos-offline-cache-v1'
+    cache_name = 'pos-offline-cache-v1'
 
     def test_01_swr_class_structure(self):
         """Test that SWR class is properly implemented"""
@@ -287,7 +283,7 @@ class TestStaleWhileRevalidate(common.TransactionCase):
 
 
 @tagged('pdc_pos_offline', 'cache_integration')
-class TestCacheIntegration(common.TransactionCase):
+class TestCacheIntegration(BaseCase):
     """Integration tests for caching system"""
 
     def test_01_precache_list_reasonable(self):
@@ -395,7 +391,7 @@ class TestCacheIntegration(common.TransactionCase):
 
 
 @tagged('pdc_pos_offline', 'offline_scenarios')
-class TestOfflineScenarios(common.TransactionCase):
+class TestOfflineScenarios(BaseCase):
     """Test real-world offline scenarios"""
 
     def test_01_complete_offline_flow(self):
@@ -0,0 +1,88 @@
+# -*- coding: utf-8 -*-
+# Copyright 2024-2026 POS.com
+# Part of POS.com Retail Management System
+# See LICENSE file for full copyright and licensing details.
+
+"""
+Tests for Service Worker Controller
+
+Tests the /pos_offline/sw.js controller:
+1. Script path, static response headers and status payload are built once
+   at import
+2. The route itself: full 200 response, then 304 on a matching If-None-Match
+"""
+
+import os
+import unittest
+
+from odoo.tests import BaseCase, HttpCase, tagged
+
+try:
+    from ..controllers.service_worker_controller import (
+        _SW_HEADERS,
+        _SW_PATH,
+        _SW_STATUS,
+    )
+except ImportError:
+    from controllers.service_worker_controller import (
+        _SW_HEADERS,
+        _SW_PATH,
+        _SW_STATUS,
+    )
+
+
+@tagged('post_install', '-at_install', 'pdc_offline')
+class TestServiceWorkerController(BaseCase):
+    """Test Service Worker controller helpers."""
+
+    def test_sw_headers(self):
+        """Test that the SW script is served uncached for the /pos/ scope."""
+        self.assertEqual(_SW_HEADERS['Service-Worker-Allowed'], '/pos/')
+        self.assertIn('no-cache', _SW_HEADERS['Cache-Control'])
+        self.assertEqual(_SW_HEADERS['Pragma'], 'no-cache')
+        self.assertEqual(_SW_HEADERS['Expires'], '0')
+
+    def test_sw_path_resolved(self):
+        """Test that the prebuilt SW path points at the shipped script."""
+        self.assertTrue(os.path.isabs(_SW_PATH))
+        self.assertTrue(_SW_PATH.endswith(os.path.join('service_worker', 'sw.js')))
+        self.assertTrue(os.path.isfile(_SW_PATH))
+
+    def test_sw_status_payload(self):
+        """Test the prebuilt /pos_offline/sw/status payload."""
+        self.assertEqual(_SW_STATUS['status'], 'active')
+        self.assertEqual(_SW_STATUS['module'], 'pdc_pos_offline')
+        self.assertEqual(_SW_STATUS['scope'], _SW_HEADERS['Service-Worker-Allowed'])
+
+
+@tagged('post_install', '-at_install', 'pdc_offline')
+class TestServiceWorkerRoute(HttpCase):
+    """Test the /pos_offline/sw.js route end to end."""
+
+    def test_sw_js_conditional_get(self):
+        """Test a full 200 response, then 304 for a matching If-None-Match."""
+        with open(_SW_PATH, 'rb') as sw_file:
+            body = sw_file.read()
+
+        response = self.url_open('/pos_offline/sw.js')
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, body)
+        self.assertEqual(int(response.headers['Content-Length']), len(body))
+        self.assertIn('javascript', response.headers['Content-Type'])
+        self.assertEqual(response.headers['Service-Worker-Allowed'], '/pos/')
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+        etag = response.headers['ETag']
+        self.assertTrue(etag)
+
+        response = self.url_open('/pos_offline/sw.js', headers={'If-None-Match': etag})
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        self.assertEqual(response.headers['ETag'], etag)
+        self.assertEqual(response.headers['Service-Worker-Allowed'], '/pos/')
+        self.assertIn('no-cache', response.headers['Cache-Control'])
+
+
+if __name__ == '__main__':
+    unittest.main()
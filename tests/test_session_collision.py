@@ -5,6 +5,7 @@
 
 from datetime import timedelta
 
+from odoo import fields
 from odoo.tests import TransactionCase, tagged
 from odoo.exceptions import ValidationError
 
@@ -21,17 +22,18 @@ class TestSessionCollision(TransactionCase):
     - Session expiry validation works correctly
     """
 
-    def setUp(self):
-        super().setUp()
-        # Create test users
-        self.user1 = self.env['res.users'].create({
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Create test users once; each test's session rows roll back on their own
+        cls.user1 = cls.env['res.users'].create({
             'name': 'Test User 1',
             'login': 'user1@test.local',
             'email': 'user1@test.local',
             'offline_session_timeout': 3600,  # 1 hour
         })
 
-        self.user2 = self.env['res.users'].create({
+        cls.user2 = cls.env['res.users'].create({
             'name': 'Test User 2',
             'login': 'user2@test.local',
             'email': 'user2@test.local',
@@ -108,11 +110,11 @@ class TestSessionCollision(TransactionCase):
 
         # Simulate time passing - set created_at to 2 hours ago
         # user1 has 3600s (1 hour) timeout, so this should be expired
-        session.created_at = self.env['ir.fields.datetime'].subtract(
-            self.env['ir.fields.datetime'].now(),
-            seconds=7200  # 2 hours ago
-        )
-        session.store()
+        past = fields.Datetime.now() - timedelta(seconds=7200)  # 2 hours ago
+        session.write({
+            'created_at': past,
+            'expires_at': past + timedelta(seconds=self.user1.offline_session_timeout),
+        })
 
         # Should now be inactive
         self.assertFalse(session.is_active)
@@ -137,11 +139,11 @@ class TestSessionCollision(TransactionCase):
         )
 
         # Simulate expiry
-        session.created_at = self.env['ir.fields.datetime'].subtract(
-            self.env['ir.fields.datetime'].now(),
-            seconds=7200  # Well past 1 hour timeout
-        )
-        session.store()
+        past = fields.Datetime.now() - timedelta(seconds=7200)  # Well past 1 hour timeout
+        session.write({
+            'created_at': past,
+            'expires_at': past + timedelta(seconds=self.user1.offline_session_timeout),
+        })
 
         # Should fail to verify
         with self.assertRaises(Exception):  # UserError
@@ -173,8 +175,11 @@ class TestSessionCollision(TransactionCase):
 
         # Wait a moment (in test, we simulate with time manipulation)
         # Then refresh
-        session.created_at = created_at_original - timedelta(seconds=1800)  # 30 min ago
-        session.store()
+        past = created_at_original - timedelta(seconds=1800)  # 30 min ago
+        session.write({
+            'created_at': past,
+            'expires_at': past + timedelta(seconds=self.user1.offline_session_timeout),
+        })
 
         # Refresh
         result = session.refresh_session()
@@ -202,24 +207,19 @@ class TestSessionCollision(TransactionCase):
         # Too short
         with self.assertRaises(ValidationError):
             self.user1.offline_session_timeout = 1800  # 30 minutes
-            self.user1.store()
 
         # Too long
         with self.assertRaises(ValidationError):
             self.user1.offline_session_timeout = 172800  # 48 hours
-            self.user1.store()
 
         # Valid (1 hour)
-        self.user1.offline_session_timeout = 3600
-        self.user1.store()  # Should not raise
+        self.user1.offline_session_timeout = 3600  # Should not raise
 
         # Valid (8 hours)
-        self.user1.offline_session_timeout = 28800
-        self.user1.store()  # Should not raise
+        self.user1.offline_session_timeout = 28800  # Should not raise
 
         # Valid (24 hours)
-        self.user1.offline_session_timeout = 86400
-        self.user1.store()  # Should not raise
+        self.user1.offline_session_timeout = 86400  # Should not raise
 
     def test_get_session_status(self):
         """Get session status information."""
@@ -246,12 +246,12 @@ class TestSessionCollision(TransactionCase):
         session_expired = self.env['pos.offline.session'].sudo(self.user2).create_offline_session(
             session_key='expired_cleanup'
         )
-        # Mark as expired
-        session_expired.created_at = self.env['ir.fields.datetime'].subtract(
-            self.env['ir.fields.datetime'].now(),
-            seconds=86400  # 24 hours ago (expired even with 8 hour default)
-        )
-        session_expired.store()
+        # Mark as expired: 24 hours ago (expired even with 8 hour default)
+        past = fields.Datetime.now() - timedelta(seconds=86400)
+        session_expired.write({
+            'created_at': past,
+            'expires_at': past + timedelta(seconds=self.user2.offline_session_timeout),
+        })
 
         active_id = session_active.id
         expired_id = session_expired.id